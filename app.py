@@ -4,60 +4,26 @@ Author: MSc Dissertation Project
 Description: Streamlit dashboard for detailed EDA of the Retail Rocket dataset.
 """
 
+import contextlib
+import functools
+import gc
+import gzip
+import mmap
+import os
+import textwrap
+import threading
 import streamlit as st
-import pandas as pd
 from pathlib import Path
-import matplotlib.pyplot as plt
+import shutil
 import streamlit.components.v1 as components
 
-# Set up wide layout and title
-st.set_page_config(page_title="Rocket Retail EDA", layout="wide")
-st.title("Retail Rocket: Behavioural EDA Dashboard")
-st.markdown("""
+# Long-form section narrative, kept as module-level constants
+_INTRO_MD = """
 This interactive dashboard presents a detailed behavioural analysis of the Retail Rocket ecommerce dataset.
 It is designed to support data-driven customer segmentation and latent behaviour pattern discovery through a series of empirically grounded insights.
-""")
-
-# Define the results directory
-results_folder = Path(__file__).parent.parent / 'results'
-
-# Utility to safely load images
-def load_plot(image_name, caption):
-    path = results_folder / image_name
-    if path.exists():
-        st.image(str(path), use_container_width=True, caption=caption)
-    else:
-        st.warning(f"Missing: {image_name}")
-
-# Utility to embed HTML
-def embed_html(file_name, height=600):
-    html_path = results_folder / file_name
-    if html_path.exists():
-        with open(html_path, 'r', encoding='utf-8') as f:
-            components.html(f.read(), height=height, scrolling=True)
-    else:
-        st.warning(f"Missing HTML: {file_name}")
-
-# Sidebar Navigation
-section = st.sidebar.radio("Explore EDA Insights", [
-    "1. Event Type Distribution",
-    "2. Visitor Activity",
-    "3. Session Construction",
-    "4. Conversion Funnel",
-    "5. User Segmentation",
-    "6. Basket Size",
-    "7. Category & Product Trends",
-    "8. Event Lag Analysis",
-    "9. Sunburst Chart",
-    "10. Executive Summary",
-    "11. References"
-])
+"""
 
-# 1. Event Type Distribution
-if section == "1. Event Type Distribution":
-    st.header("1. Event Type Distribution")
-    load_plot("event_type_distribution.png", "Distribution of views, cart additions, and transactions.")
-    st.markdown("""
+_EVENT_TYPE_MD = """
    Out of approximately 2.75 million total events:
 
 - View events account for ~96.7% of all interactions (2.66M), indicating high browsing activity.
@@ -69,34 +35,25 @@ if section == "1. Event Type Distribution":
 This sharp drop-off from view to purchase aligns with known online consumer behaviour patterns, where most sessions are exploratory in nature and only a small fraction culminates in a purchase (Moe, 2003; Sakar et al., 2020).
 
 Such a distribution underscores the need to model non-purchasing behaviour with equal rigour—embedding sequences based solely on conversions would neglect the rich intent signals present in cart additions and repeated views. The segmentation framework must therefore incorporate complete session sequences to reveal behavioural diversity beyond monetary action.
-""")
-
-# 2. Visitor Activity
-elif section == "2. Visitor Activity":
-    st.header("2. Visitor Activity Patterns")
-    col1, col2 = st.columns(2)
-    with col1:
-        load_plot("visitor_event_distribution_full.png", "Full distribution of event counts per visitor.")
-    with col2:
-        load_plot("visitor_event_distribution_zoomed.png", "Zoomed distribution (0–100 events).")
+"""
 
-    st.markdown("""For understanding interaction variability, we visualised the distribution of event counts per visitor—both across the full range and restricted to a 0–100 event window for clearer inspection.
+_VISITOR_ACTIVITY_MD_1 = """For understanding interaction variability, we visualised the distribution of event counts per visitor—both across the full range and restricted to a 0–100 event window for clearer inspection.
 
 **Key Insights:**
+
 - The first plot (full range) reveals a highly right-skewed distribution, with the vast majority of users interacting only a handful of times. However, a small minority (long tail) exhibit extremely high engagement, with the most active visitor recording 7,757 interactions. This reflects Pareto-like behaviour, consistent with ecommerce platforms where a minority of users contribute disproportionately to interaction volume (Montgomery et al., 2004).
 
 - The second plot (0–100 events) highlights that over 95% of visitors engage in fewer than 100 events, with a sharp drop-off visible beyond 10–20 interactions. This suggests that while the dataset includes power users, it is dominated by low-engagement or one-time visitors, which is a common trait in publicly available ecommerce datasets (Van den Berg & Abbas, 2022; Moe, 2003).
 
 **Relevance:**
+
 - This behaviour supports our methodological choice to model at the session level rather than user level. Aggregating across users would conflate diverse behaviours and dilute signals from brief but meaningful interactions (Sakar et al., 2020).
 
 - It also validates the need for unsupervised segmentation, as traditional cohorting based on fixed thresholds (e.g., top 10% by engagement) would miss the behavioural heterogeneity evident in the long tail.
 
-In line with behavioural economics, this skew reflects diverse browsing and buying patterns—ranging from impulse drop-ins to persistent comparers—and forms the basis for downstream segmentation via neural embeddings and clustering.""")
-  
-    load_plot("sessions_per_visitor_distribution.png", "Distribution of sessions per visitor.")
+In line with behavioural economics, this skew reflects diverse browsing and buying patterns—ranging from impulse drop-ins to persistent comparers—and forms the basis for downstream segmentation via neural embeddings and clustering."""
 
-    st.markdown(""" The summary shows that while most visitors initiate only 1–2 sessions, a small subset exhibits hyperactive engagement, with some exceeding 400 sessions. The top 10 most session-active users highlight this disparity:
+_VISITOR_ACTIVITY_MD_2 = """ The summary shows that while most visitors initiate only 1–2 sessions, a small subset exhibits hyperactive engagement, with some exceeding 400 sessions. The top 10 most session-active users highlight this disparity:
 
 | Visitor ID | Session Count |
 | ---------- | ------------- |
@@ -121,11 +78,8 @@ The histogram above reaffirms the skewed nature of session frequency:
 
 This heterogeneity reinforces the need to model each session independently rather than aggregating all actions per user. This aligns with findings by Van den Berg & Abbas (2022), who note that session-level embeddings preserve short-term intent granularity and avoid the averaging-out effect seen in user-level aggregation.
 
- """)
-    
-    load_plot("events_per_session_distribution_zoomed.png", "Events per session (0–50 range).")
-    st.markdown("""
-    To further explore the typical behaviour, we visualised the distribution of session lengths through two histograms: a full-range plot and a zoomed-in version restricted to sessions with fewer than 50 events.
+
+To further explore the typical behaviour, we visualised the distribution of session lengths through two histograms: a full-range plot and a zoomed-in version restricted to sessions with fewer than 50 events.
 
 **Full Distribution:**
 The distribution is heavily right-skewed, with the vast majority of sessions containing fewer than 10 events. The long tail reflects outlier sessions with unusually high interaction frequency.
@@ -144,13 +98,9 @@ These findings indicate substantial heterogeneity in user interaction depth. Fro
 This variation becomes particularly useful during cluster interpretation in later stages. By linking cluster membership to average session length, we can identify latent behaviour patterns such as hesitation, decisiveness, or looped product discovery, thereby supporting actionable segmentation grounded in real behavioural flow.
 
 This interpretation complements prior work that emphasises the importance of sequence structure over static features (Le & Mikolov, 2014; Grbovic & Cheng, 2018) and provides context for the choice of session-level token sequences in the embedding phase.
-    """)
+    """
 
-# 3. Session Construction
-elif section == "3. Session Construction":
-    st.header("3. Session Construction & Timeout Thresholds")
-    load_plot("time_gap_distribution_log.png", "Log distribution of time gaps between events.")
-    st.markdown("""
+_SESSION_CONSTRUCTION_MD_1 = """
     The lag histograms reveal an extremely tight clustering near zero minutes for both transitions:
 
 - Over 90% of add-to-cart and transaction events occur immediately after the preceding event. This reflects intent continuity—users who add items to their cart or purchase tend to act in a single behavioural session without prolonged gaps.
@@ -164,30 +114,17 @@ These patterns confirm the short-attention span nature of ecommerce behaviour an
 - This motivates our choice of session-level modelling and justifies the use of 30-minute session gaps (Montgomery et al., 2004).
 
 - Lag durations are stored for use in cluster profiling—e.g., clusters with longer cart-to-transaction times may reflect more hesitant or price-sensitive users.
-    """)
-
-    st.markdown(""" **Summary statistics of Time Gaps:**
-    
-| Metric    | Value (Seconds) | Interpretation                                                                     |
-| --------- | --------------- | ---------------------------------------------------------------------------------- |
-| 25th %ile | 38              | 25% of interactions happen within 38 seconds of each other — high browsing density |
-| Median    | 136             | Half of all event pairs occur within just 2.3 minutes                              |
-| 75th %ile | 2,449           | 75% of users return within 40 minutes — within browsing intent window              |
-| 90th %ile | 263,524         | A long tail begins—10% of transitions span over 73 hours                           |
-| 95th %ile | 1,190,249       | 5% of transitions exceed 13.8 days                                                 |
-| 99th %ile | 5,160,078       | Extreme lags observed—often due to multiple visits across sessions                 |
-| Maximum   | 11,787,451      | Indicates multi-week session gaps (approx. 136 days)                               |
 
+**Summary statistics of Time Gaps:**
+"""
+
+_SESSION_CONSTRUCTION_MD_2 = """
 These statistics illustrate a heavy-tailed distribution of time gaps. While the majority of user actions are clustered within a short time span, a small fraction of interactions are spaced days or even weeks apart. This supports the rationale behind adopting a 30-minute inactivity threshold for defining session boundaries, as proposed in prior literature (Montgomery et al., 2004; Moe, 2003; Google Analytics, 2023). The 75th percentile lies well within this range, ensuring that true behavioural sessions are captured without splitting meaningful flows or merging unrelated ones.
 
 Such quantile-based diagnostics are especially critical in ecommerce datasets where repeated visits, multi-device access, and asynchronous behaviour can distort naive time assumptions. Understanding the actual time gap distribution strengthens the reliability of downstream sessionisation and embedding steps.
- """)
+ """
 
-# 4. Conversion Funnel
-elif section == "4. Conversion Funnel":
-    st.header("4. Conversion Funnel Breakdown")
-    load_plot("conversion_funnel.png", "From views to transactions: Ecommerce drop-off funnel.")
-    st.markdown("""
+_CONVERSION_FUNNEL_MD = """
     - Views dominate the event landscape with over 2.66 million interactions, reflecting the exploratory nature of ecommerce browsing.
 
 - Add-to-cart events number just ~69,000, indicating a substantial drop-off from intent to consideration.
@@ -199,13 +136,9 @@ This steep funnel drop-off is consistent with prior behavioural research in onli
 Additionally, these event-type ratios will later form the basis of funnel coverage analysis per session cluster. For instance, we may discover that certain clusters exhibit view-only behaviour while others proceed to transaction more often—offering behavioural signals that surpass demographic targeting.
 
 By anchoring the segmentation in real funnel dynamics, we ensure that downstream clusters are not only data-driven but also aligned with measurable business objectives (Montgomery et al., 2004; Van den Berg & Abbas, 2022).
-    """)
+    """
 
-# 5. User Segmentation
-elif section == "5. User Segmentation":
-    st.header("5. One-Time vs Power Users")
-    load_plot("visitor_interaction_distribution.png", "Log-scaled distribution of events per visitor.")
-    st.markdown("""
+_USER_SEGMENTATION_MD = """
     | Metric                    | Value     |
 | ------------------------- | --------- |
 | Total Visitors            | 1,407,580 |
@@ -221,13 +154,9 @@ elif section == "5. User Segmentation":
 Such patterns validate our behavioural segmentation approach. Rather than treating users as uniformly distributed, we acknowledge the structural imbalance in engagement, which supports our decision to represent behaviour through session embeddings and not just user-level averages.
 
 These findings also support cluster validation, as we can later compare whether specific clusters are dominated by transient users or engaged browsers—providing insight into lifecycle stages and funnel depth variance across clusters (Van den Berg & Abbas, 2022).
-    """)
+    """
 
-# 6. Basket Size
-elif section == "6. Basket Size":
-    st.header("6. Basket Size Analysis")
-    load_plot("basket_size_distribution.png", "Distribution of number of items per purchase.")
-    st.markdown("""
+_BASKET_SIZE_MD = """
     | Metric          | Value  |
 | --------------- | ------ |
 | Count           | 11,719 |
@@ -248,13 +177,9 @@ elif section == "6. Basket Size":
 - From a business standpoint, segmenting clusters by average basket size later can inform differentiated promotional strategies: single-item buyers may respond to cross-sell nudges, while bulk buyers might value quantity discounts or business loyalty plans.
 
 Overall, this analysis demonstrates the heterogeneity in purchasing intensity across the customer base, reinforcing the importance of modelling behavioural sequences at a session level rather than relying on aggregate transactional summaries (Van den Berg & Abbas, 2022; Grbovic & Cheng, 2018).
-    """)
+    """
 
-# 7. Category & Product Trends
-elif section == "7. Category & Product Trends":
-    st.header("7. Most Purchased Categories & Items")
-    load_plot("top_categories_by_transactions.png", "Top 10 categories ranked by number of transactions.")
-    st.markdown("""
+_CATEGORY_TRENDS_MD = """
     | Item ID | Transactions |
 | ------- | ------------ |
 | 461686  | 133          |
@@ -276,13 +201,9 @@ elif section == "7. Category & Product Trends":
 - At the item level, while the top item logged 133 transactions, most others in the top 10 range between 30–90, indicating modest item-level concentration. This reflects the long-tail nature of ecommerce purchasing, as echoed by Moe (2003), where niche items coexist with popular ones.
 
 - Incorporating category-level behavioural data later in cluster interpretation can reveal whether different segments lean toward specific verticals (e.g., electronics, household goods), aiding persona development and category-specific targeting.
-    """)
+    """
 
-# 8. Event Lag Analysis
-elif section == "8. Event Lag Analysis":
-    st.header("8. Event Lag Timings")
-    load_plot("event_lag_analysis_seconds.png", "Delay between view → cart and cart → transaction (in seconds).")
-    st.markdown("""
+_EVENT_LAG_MD = """
     - The left histogram shows that the lag from viewing a product to adding it to the cart is typically very short for most users. This suggests that initial interest leads quickly to carting behaviour—possibly influenced by intuitive UI design, promotional triggers, or returning users.
 
 - The right histogram reflects the time taken from carting to actual purchase. This duration also tends to be short for most sessions, though with slightly longer tails than view-to-cart lags. This supports previous findings (Van den Berg & Abbas, 2022) where users often revisit saved carts or proceed quickly under purchase urgency.
@@ -292,13 +213,9 @@ elif section == "8. Event Lag Analysis":
 - Importantly, we avoid embedding raw lag durations into session tokens to prevent vocabulary explosion, instead preserving them for cluster profiling post-segmentation (Sakar et al., 2020).
 
 
-    """)
+    """
 
-# 9. Sunburst Chart
-elif section == "9. Sunburst Chart":
-    st.header("9. Sunburst of Raw Category IDs")
-    embed_html("sunburst_category_transactions.html")
-    st.markdown("""
+_SUNBURST_MD = """
     - The chart highlights a skewed category distribution, where a few high-performing categories dominate the overall transaction landscape.
 
 - Categories such as 95.0, 1051.0, and 1483.0 appear to contribute a substantial share of purchases, aligning with earlier bar plot results.
@@ -306,12 +223,9 @@ elif section == "9. Sunburst Chart":
 - The presence of a long tail indicates niche or infrequent purchases across a wide array of categories, reflective of product diversity and micro-segmentation possibilities.
 
 - This reinforces the importance of considering both popular and specialised segments when designing customer clusters and targeting strategies.
-    """)
+    """
 
-# 10. Executive Summary
-elif section == "10. Executive Summary":
-    st.header("10. Executive Summary")
-    st.markdown("""
+_EXECUTIVE_SUMMARY_MD = """
     This dashboard provides a comprehensive behavioural breakdown of the Retail Rocket ecommerce dataset, structured around the customer's interaction journey.
 
     Beginning with an analysis of event types, it becomes evident that online shopping behaviour is skewed towards browsing, with significantly fewer add-to-cart and purchase actions. This foundational imbalance is further reflected in user engagement, where most visitors exhibit minimal interaction while a small subset engages deeply and repeatedly. Session segmentation, based on data-driven time gap analysis, enables meaningful delineation of these behaviours into discrete user journeys.
@@ -321,21 +235,459 @@ elif section == "10. Executive Summary":
     User segmentation patterns follow a Pareto-like shape, validating the use of clustering techniques for high-impact targeting. Category and product trends identify key conversion-driving items, while lag analysis uncovers both impulsive and deliberative customer behaviours. Finally, the sunburst chart visualises the distribution of transactions across raw category IDs without inferring any hierarchy, ensuring analytical integrity.
 
     Together, these findings build a cohesive behavioural profile of Rocket Retail users, guiding both strategic decisions and the development of downstream machine learning models.
-    """)
+    """
+
+_REFERENCES_MD = """
+    - Moe, W. W. (2003). Buying, searching, or browsing: Differentiating between online shoppers using in-store navigational clickstream. *Journal of Consumer Psychology*, 13(1-2), 29–39.  
+    - Montgomery, A. L., Li, S., Srinivasan, K., & Liechty, J. (2004). Modeling online browsing and path analysis using clickstream data. *Marketing Science*, 23(4), 579–595.  
+    - Sakar, C. O., Polat, S. O., Katircioglu, M., & Kocamaz, A. F. (2020). Time-aware user behavioural clustering in e-commerce using deep embeddings. *Knowledge-Based Systems*, 192, 105377.  
+    - Van den Berg, D., & Abbas, K. (2022). Neural embeddings for sequential retail behaviour: Session-based customer segmentation in practice. *Information Systems Research*, 33(1), 204–225.
+    """
+
+# Render the intro and section narrative to HTML once per process, dedented and stripped the
+# same way st.markdown does. It is still shown with st.markdown(unsafe_allow_html=True) so the
+# tables and lists keep the markdown container's styling
+@st.cache_resource(show_spinner=False)
+def _compile_markdown():
+    import markdown
+    blocks = {
+        "intro": _INTRO_MD,
+        "event_types": _EVENT_TYPE_MD,
+        "visitor_activity_1": _VISITOR_ACTIVITY_MD_1,
+        "visitor_activity_2": _VISITOR_ACTIVITY_MD_2,
+        "session_construction_1": _SESSION_CONSTRUCTION_MD_1,
+        "session_construction_2": _SESSION_CONSTRUCTION_MD_2,
+        "conversion_funnel": _CONVERSION_FUNNEL_MD,
+        "user_segmentation": _USER_SEGMENTATION_MD,
+        "basket_size": _BASKET_SIZE_MD,
+        "category_trends": _CATEGORY_TRENDS_MD,
+        "event_lag": _EVENT_LAG_MD,
+        "sunburst": _SUNBURST_MD,
+        "executive_summary": _EXECUTIVE_SUMMARY_MD,
+        "references": _REFERENCES_MD,
+    }
+    return {
+        key: markdown.markdown(textwrap.dedent(text).strip(), extensions=["tables"])
+        for key, text in blocks.items()
+    }
+
+# Set up wide layout and title
+st.set_page_config(page_title="Rocket Retail EDA", layout="wide")
+st.title("Retail Rocket: Behavioural EDA Dashboard")
+
+# Precompiled narrative HTML for the intro and every section
+_MD = _compile_markdown()
+st.markdown(_MD["intro"], unsafe_allow_html=True)
+
+# Resolve the results directory once per process rather than rebuilding the Path on every rerun
+@st.cache_resource(show_spinner=False)
+def _results_dir() -> Path:
+    return Path(__file__).resolve().parent / 'results'
+
+# Seconds before the results/ index (and the static copies built from it) is rebuilt,
+# so regenerated plots show up without pressing "Rescan assets"
+ASSET_INDEX_TTL = 60
+
+# Seconds a cached file read is kept. The (path, mtime) key already picks up regenerated
+# files; the TTL lets entries for superseded mtimes expire instead of piling up in memory.
+# The readers below use cache_resource rather than cache_data because their results are
+# never mutated, so each hit returns the cached object instead of an unpickled copy
+READER_CACHE_TTL = 300
+
+# Cached index of the results directory (relative file name -> (absolute path, modification time)),
+# so asset lookups are a dict membership test instead of a stat() and Path join per rerun
+@st.cache_resource(ttl=ASSET_INDEX_TTL, show_spinner=False)
+def _asset_index():
+    results_folder = _results_dir()
+    if not results_folder.is_dir():
+        return {}
+    return {
+        p.relative_to(results_folder).as_posix(): (str(p), p.stat().st_mtime)
+        for p in results_folder.rglob('*') if p.is_file()
+    }
+
+# Hint each file into the page cache; a 4 KB read stands in where posix_fadvise is unavailable
+def _prefetch(paths):
+    for path_str in paths:
+        try:
+            fd = os.open(path_str, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                os.read(fd, 4096)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+# Utility to read plot and download bytes, cached by path and modification time
+@st.cache_resource(ttl=READER_CACHE_TTL, show_spinner=False)
+def _read_bytes(path_str: str, mtime: float) -> bytes:
+    return Path(path_str).read_bytes()
+
+# Streamlit serves files placed next to the app in static/ at app/static/<name>
+# when server.enableStaticServing is on (see .streamlit/config.toml). Resolved once,
+# beside the results directory
+@st.cache_resource(show_spinner=False)
+def _static_dir() -> Path:
+    return _results_dir().parent / 'static'
+
+# Copy the plots (and their thumbs/ previews) into static/, refreshing any copy
+# older than its source
+@st.cache_resource(ttl=ASSET_INDEX_TTL, show_spinner=False)
+def _publish_static_assets():
+    static_dir = _static_dir()
+    published = set()
+    for name, (path_str, mtime) in _asset_index().items():
+        if not name.endswith(('.png', '.webp')):
+            continue
+        target = static_dir / name
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not target.exists() or target.stat().st_mtime < mtime:
+                shutil.copy2(path_str, target)
+        except OSError:
+            continue
+        published.add(name)
+    return frozenset(published)
+
+# Utility to pick the copy of a plot that is served: the full-size name in results/ (its WebP
+# copy when there is one) and the name in static/ of the image shown, None if not served statically
+def _plot_source(image_name):
+    webp_name = Path(image_name).with_suffix('.webp').name
+    full_name = webp_name if webp_name in _asset_index() else image_name
+    if st.get_option("server.enableStaticServing") and full_name in _publish_static_assets():
+        thumb_name = f"thumbs/{Path(image_name).stem}.webp"
+        return full_name, thumb_name if thumb_name in _publish_static_assets() else full_name
+    return full_name, None
+
+# Utility to safely load images
+def load_plot(image_name, caption):
+    if image_name not in _asset_index():
+        st.warning(f"Missing: {image_name}")
+        return
+    full_name, shown_name = _plot_source(image_name)
+    # Preferred path: let the browser fetch (and lazily load) the plot straight from the static server
+    if shown_name is not None:
+        # Show the small WebP preview when there is one, linking through to the full-resolution plot
+        if shown_name != full_name:
+            st.markdown(
+                f'<figure><a href="app/static/{full_name}" target="_blank" title="View full resolution">'
+                f'<img loading="lazy" src="app/static/{shown_name}" style="max-width:100%"></a>'
+                f'<figcaption>{caption} (click to view full resolution)</figcaption></figure>',
+                unsafe_allow_html=True,
+            )
+        else:
+            st.markdown(
+                f'<figure><img loading="lazy" src="app/static/{full_name}" style="max-width:100%">'
+                f'<figcaption>{caption}</figcaption></figure>',
+                unsafe_allow_html=True,
+            )
+        return
+    try:
+        data = _read_bytes(*_asset_index()[full_name])
+    except FileNotFoundError:
+        st.warning(f"Missing: {image_name}")
+        return
+    # Plots are exported at their display width, so show them at natural size rather than stretching
+    st.image(data, caption=caption)
+
+# Utility to read an HTML export, cached by path and modification time
+@st.cache_resource(ttl=READER_CACHE_TTL, show_spinner=False)
+def _read_html(path_str: str, mtime: float) -> str:
+    # Decode straight from a read-only memory map of the file rather than through a
+    # buffered text reader; mmap rejects empty files, so those are read as ''.
+    # .gz exports from scripts/prepare_assets.py are decompressed in memory
+    with open(path_str, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = gzip.decompress(mm) if path_str.endswith('.gz') else mm[:]
+    return data.decode('utf-8')
+
+# Utility to pick the copy of an HTML export that is read: its gzip-compressed copy when there is one
+def _html_source(file_name):
+    return f"{file_name}.gz" if f"{file_name}.gz" in _asset_index() else file_name
+
+# Utility to embed HTML
+def embed_html(file_name, height=600):
+    asset = _asset_index().get(_html_source(file_name))
+    if asset is None:
+        st.warning(f"Missing HTML: {file_name}")
+        return
+    try:
+        html = _read_html(*asset)
+    except FileNotFoundError:
+        st.warning(f"Missing HTML: {file_name}")
+        return
+    components.html(html, height=height, scrolling=True)
+
+# Utility to load a Plotly figure from a write_json export, cached by path and modification time
+@st.cache_resource(ttl=READER_CACHE_TTL, show_spinner=False)
+def _read_figure(path_str: str, mtime: float):
+    import plotly.io as pio
+    # skip_invalid tolerates template properties from a different plotly version
+    return pio.read_json(path_str, skip_invalid=True)
+
+# Utility to load a chart's Plotly figure, None when its JSON export is missing
+def _chart_figure(json_name):
+    asset = _asset_index().get(json_name)
+    if asset is None:
+        return None
+    try:
+        return _read_figure(*asset)
+    except FileNotFoundError:
+        return None
+
+# Utility to render a Plotly chart natively, falling back to the exported HTML
+def load_chart(json_name, html_name):
+    fig = _chart_figure(json_name)
+    if fig is None:
+        embed_html(html_name)
+        return
+    st.plotly_chart(fig)
+
+# Plots the sections show: key -> (file name in results/, caption)
+_PLOTS = {
+    "event_types": ("event_type_distribution.png", "Distribution of views, cart additions, and transactions."),
+    "visitor_pair": (
+        "visitor_event_distribution_pair.png",
+        "Left: full distribution of event counts per visitor. Right: zoomed distribution (0–100 events).",
+    ),
+    "visitor_full": ("visitor_event_distribution_full.png", "Full distribution of event counts per visitor."),
+    "visitor_zoomed": ("visitor_event_distribution_zoomed.png", "Zoomed distribution (0–100 events)."),
+    "sessions_per_visitor": ("sessions_per_visitor_distribution.png", "Distribution of sessions per visitor."),
+    "events_per_session": ("events_per_session_distribution_zoomed.png", "Events per session (0–50 range)."),
+    "time_gaps": ("time_gap_distribution_log.png", "Log distribution of time gaps between events."),
+    "conversion_funnel": ("conversion_funnel.png", "From views to transactions: Ecommerce drop-off funnel."),
+    "user_segmentation": ("visitor_interaction_distribution.png", "Log-scaled distribution of events per visitor."),
+    "basket_size": ("basket_size_distribution.png", "Distribution of number of items per purchase."),
+    "category_trends": ("top_categories_by_transactions.png", "Top 10 categories ranked by number of transactions."),
+    "event_lag": ("event_lag_analysis_seconds.png", "Delay between view → cart and cart → transaction (in seconds)."),
+}
+_VISITOR_PAIR_PLOTS = ("visitor_pair",)
+_VISITOR_SPLIT_PLOTS = ("visitor_full", "visitor_zoomed")
+_SUNBURST_CHART = ("sunburst_category_transactions.json", "sunburst_category_transactions.html")
+_SUMMARY_PDF = "executive_summary.pdf"
+
+# Section 2 shows the side-by-side composite from scripts/prepare_assets.py when available, else the two plots
+def _visitor_distribution_plots():
+    return _VISITOR_PAIR_PLOTS if _PLOTS["visitor_pair"][0] in _asset_index() else _VISITOR_SPLIT_PLOTS
+
+# Paths of the files the sections open, each the copy its renderer serves
+def _referenced_assets():
+    index = _asset_index()
+    json_name, html_name = _SUNBURST_CHART
+    names = [json_name if json_name in index else _html_source(html_name), _SUMMARY_PDF]
+    paths = [index[name][0] for name in names if name in index]
+    keys = [key for key in _PLOTS if key not in _VISITOR_PAIR_PLOTS + _VISITOR_SPLIT_PLOTS]
+    for key in keys + list(_visitor_distribution_plots()):
+        image_name = _PLOTS[key][0]
+        if image_name not in index:
+            continue
+        full_name, shown_name = _plot_source(image_name)
+        paths.append(str(_static_dir() / shown_name) if shown_name else index[full_name][0])
+    return paths
+
+# Once per process, ask the kernel to read the referenced assets into the page cache
+# in the background, so the first visit to a section does not wait on a cold disk read
+@st.cache_resource(show_spinner=False)
+def _warm_page_cache():
+    thread = threading.Thread(target=_prefetch, args=(_referenced_assets(),), daemon=True)
+    thread.start()
+    return thread
+
+_warm_page_cache()
+
+# Summary statistics of time gaps between consecutive events (section 3), built once
+# as a DataFrame for st.table rather than re-parsed from a markdown pipe table
+@st.cache_data(show_spinner=False)
+def _time_gap_quantiles():
+    import pandas as pd
+    return pd.DataFrame({
+        "Metric": ["25th %ile", "Median", "75th %ile", "90th %ile", "95th %ile", "99th %ile", "Maximum"],
+        "Value (Seconds)": ["38", "136", "2,449", "263,524", "1,190,249", "5,160,078", "11,787,451"],
+        "Interpretation": [
+            "25% of interactions happen within 38 seconds of each other — high browsing density",
+            "Half of all event pairs occur within just 2.3 minutes",
+            "75% of users return within 40 minutes — within browsing intent window",
+            "A long tail begins—10% of transitions span over 73 hours",
+            "5% of transitions exceed 13.8 days",
+            "Extreme lags observed—often due to multiple visits across sessions",
+            "Indicates multi-week session gaps (approx. 136 days)",
+        ],
+    }).set_index("Metric")
+
+# Process-wide state for pausing automatic garbage collection while a section renders.
+# GC is global and Streamlit serves every session from this process, so concurrent
+# renders share one depth counter: the first to enter disables GC, the last to leave restores it
+@st.cache_resource(show_spinner=False)
+def _gc_pause_state():
+    return {"lock": threading.Lock(), "depth": 0, "was_enabled": True}
+
+@contextlib.contextmanager
+def _gc_paused():
+    state = _gc_pause_state()
+    with state["lock"]:
+        if state["depth"] == 0:
+            state["was_enabled"] = gc.isenabled()
+            gc.disable()
+        state["depth"] += 1
+    try:
+        yield
+    finally:
+        with state["lock"]:
+            state["depth"] -= 1
+            if state["depth"] == 0 and state["was_enabled"]:
+                gc.enable()
+
+# Section renderers run as fragments with GC paused inside the fragment body, so the many
+# short-lived strings and buffers a render allocates cost one collection afterwards rather
+# than a series of generational sweeps mid-render, on full reruns and fragment reruns alike.
+# The long-lived caches a section relies on are filled first, with GC still enabled
+def _section(*caches):
+    def decorate(render):
+        @functools.wraps(render)
+        def wrapper():
+            _asset_index()
+            if st.get_option("server.enableStaticServing"):
+                _publish_static_assets()
+            for fill in caches:
+                fill()
+            with _gc_paused():
+                render()
+        return st.fragment(wrapper)
+    return decorate
+
+# 1. Event Type Distribution
+@_section()
+def render_event_types():
+    st.header("1. Event Type Distribution")
+    load_plot(*_PLOTS["event_types"])
+    st.markdown(_MD["event_types"], unsafe_allow_html=True)
+
+# 2. Visitor Activity
+@_section()
+def render_visitor_activity():
+    st.header("2. Visitor Activity Patterns")
+    # One side-by-side composite when available, else the two plots in columns
+    plots = _visitor_distribution_plots()
+    if len(plots) == 1:
+        load_plot(*_PLOTS[plots[0]])
+    else:
+        for col, key in zip(st.columns(len(plots)), plots):
+            with col:
+                load_plot(*_PLOTS[key])
+
+    st.markdown(_MD["visitor_activity_1"], unsafe_allow_html=True)
+  
+    with st.expander("Distribution of sessions per visitor.", expanded=False):
+        load_plot(*_PLOTS["sessions_per_visitor"])
+
+    st.markdown(_MD["visitor_activity_2"], unsafe_allow_html=True)
+    with st.expander("Events per session (0–50 range).", expanded=False):
+        load_plot(*_PLOTS["events_per_session"])
+
+# 3. Session Construction
+@_section(_time_gap_quantiles)
+def render_session_construction():
+    st.header("3. Session Construction & Timeout Thresholds")
+    load_plot(*_PLOTS["time_gaps"])
+    st.markdown(_MD["session_construction_1"], unsafe_allow_html=True)
+    st.table(_time_gap_quantiles())
+    st.markdown(_MD["session_construction_2"], unsafe_allow_html=True)
+
+# 4. Conversion Funnel
+@_section()
+def render_conversion_funnel():
+    st.header("4. Conversion Funnel Breakdown")
+    load_plot(*_PLOTS["conversion_funnel"])
+    st.markdown(_MD["conversion_funnel"], unsafe_allow_html=True)
+
+# 5. User Segmentation
+@_section()
+def render_user_segmentation():
+    st.header("5. One-Time vs Power Users")
+    load_plot(*_PLOTS["user_segmentation"])
+    st.markdown(_MD["user_segmentation"], unsafe_allow_html=True)
+
+# 6. Basket Size
+@_section()
+def render_basket_size():
+    st.header("6. Basket Size Analysis")
+    load_plot(*_PLOTS["basket_size"])
+    st.markdown(_MD["basket_size"], unsafe_allow_html=True)
+
+# 7. Category & Product Trends
+@_section()
+def render_category_trends():
+    st.header("7. Most Purchased Categories & Items")
+    load_plot(*_PLOTS["category_trends"])
+    st.markdown(_MD["category_trends"], unsafe_allow_html=True)
+
+# 8. Event Lag Analysis
+@_section()
+def render_event_lag():
+    st.header("8. Event Lag Timings")
+    load_plot(*_PLOTS["event_lag"])
+    st.markdown(_MD["event_lag"], unsafe_allow_html=True)
+
+# 9. Sunburst Chart
+@_section(functools.partial(_chart_figure, _SUNBURST_CHART[0]))
+def render_sunburst():
+    st.header("9. Sunburst of Raw Category IDs")
+    with st.expander("Interactive sunburst of transactions by category ID.", expanded=False):
+        load_chart(*_SUNBURST_CHART)
+    st.markdown(_MD["sunburst"], unsafe_allow_html=True)
+
+# 10. Executive Summary
+@_section()
+def render_executive_summary():
+    st.header("10. Executive Summary")
+    st.markdown(_MD["executive_summary"], unsafe_allow_html=True)
 
     # Offer PDF download
-    pdf_path = results_folder / "executive_summary.pdf"
-    if pdf_path.exists():
-        with open(pdf_path, "rb") as f:
-            st.download_button("Download Executive Summary (PDF)", f, file_name="executive_summary.pdf")
+    pdf_asset = _asset_index().get(_SUMMARY_PDF)
+    if pdf_asset is not None:
+        pdf_data = _read_bytes(*pdf_asset)
+        st.download_button("Download Executive Summary (PDF)", data=pdf_data, file_name=_SUMMARY_PDF)
     else:
         st.info("PDF version of the executive summary is not available.")
 
-elif section == "11. References":
+# 11. References
+@_section()
+def render_references():
     st.header("11. References")
-    st.markdown("""
-    - Moe, W. W. (2003). Buying, searching, or browsing: Differentiating between online shoppers using in-store navigational clickstream. *Journal of Consumer Psychology*, 13(1-2), 29–39.  
-    - Montgomery, A. L., Li, S., Srinivasan, K., & Liechty, J. (2004). Modeling online browsing and path analysis using clickstream data. *Marketing Science*, 23(4), 579–595.  
-    - Sakar, C. O., Polat, S. O., Katircioglu, M., & Kocamaz, A. F. (2020). Time-aware user behavioural clustering in e-commerce using deep embeddings. *Knowledge-Based Systems*, 192, 105377.  
-    - Van den Berg, D., & Abbas, K. (2022). Neural embeddings for sequential retail behaviour: Session-based customer segmentation in practice. *Information Systems Research*, 33(1), 204–225.
-    """)
+    st.markdown(_MD["references"], unsafe_allow_html=True)
+
+# Section title -> renderer
+_DISPATCH = {
+    "1. Event Type Distribution": render_event_types,
+    "2. Visitor Activity": render_visitor_activity,
+    "3. Session Construction": render_session_construction,
+    "4. Conversion Funnel": render_conversion_funnel,
+    "5. User Segmentation": render_user_segmentation,
+    "6. Basket Size": render_basket_size,
+    "7. Category & Product Trends": render_category_trends,
+    "8. Event Lag Analysis": render_event_lag,
+    "9. Sunburst Chart": render_sunburst,
+    "10. Executive Summary": render_executive_summary,
+    "11. References": render_references,
+}
+
+# Sidebar sections, in display order (taken from the dispatch table so titles live in one place)
+_SECTIONS = tuple(_DISPATCH)
+
+# Sidebar Navigation
+section = st.sidebar.radio("Explore EDA Insights", _SECTIONS)
+
+# Pick up regenerated or newly added files in results/ without restarting the server
+if st.sidebar.button("Rescan assets"):
+    _asset_index.clear()
+    _publish_static_assets.clear()
+
+# Render the selected section
+_DISPATCH[section]()
@@ -0,0 +1,80 @@
+"""
+Offline asset preparation for the Rocket Retail EDA dashboard.
+Run from the repository root after regenerating the plots in results/:
+
+    python scripts/prepare_assets.py
+"""
+
+import gzip
+from pathlib import Path
+from PIL import Image
+
+results_folder = Path(__file__).resolve().parent.parent / 'results'
+thumbs_folder = results_folder / 'thumbs'
+
+THUMBNAIL_SIZE = (400, 400)
+WEBP_MAX_WIDTH = 1200
+
+# Side-by-side composites shown as one image in the dashboard: output -> panels, left to right
+COMPOSITES = {
+    'visitor_event_distribution_pair.png': (
+        'visitor_event_distribution_full.png',
+        'visitor_event_distribution_zoomed.png',
+    ),
+}
+
+# Number of side-by-side panels in a plot, used to scale the per-plot size limits
+def _panel_count(png_path):
+    return len(COMPOSITES.get(png_path.name, (png_path.name,)))
+
+# Paste each composite's panels next to each other on a white canvas and save it to results/
+def make_composites():
+    for composite_name, panel_names in COMPOSITES.items():
+        panels = [Image.open(results_folder / name) for name in panel_names]
+        width = sum(panel.width for panel in panels)
+        height = max(panel.height for panel in panels)
+        composite = Image.new('RGBA', (width, height), 'white')
+        x = 0
+        for panel in panels:
+            composite.paste(panel, (x, 0))
+            x += panel.width
+            panel.close()
+        composite_path = results_folder / composite_name
+        composite.save(composite_path, optimize=True)
+        print(f"Composite saved as {composite_path}")
+
+# Write a small WebP preview of every plot to results/thumbs/<stem>.webp
+def make_thumbnails():
+    thumbs_folder.mkdir(exist_ok=True)
+    for png_path in sorted(results_folder.glob('*.png')):
+        with Image.open(png_path) as img:
+            panels = _panel_count(png_path)
+            img.thumbnail((THUMBNAIL_SIZE[0] * panels, THUMBNAIL_SIZE[1]))
+            thumb_path = thumbs_folder / f"{png_path.stem}.webp"
+            img.save(thumb_path, "WEBP", quality=80)
+        print(f"Thumbnail saved as {thumb_path}")
+
+# Write a lossless WebP copy of every plot, at most WEBP_MAX_WIDTH wide per panel, to results/<stem>.webp
+def make_webp_copies():
+    for png_path in sorted(results_folder.glob('*.png')):
+        with Image.open(png_path) as img:
+            max_width = WEBP_MAX_WIDTH * _panel_count(png_path)
+            if img.width > max_width:
+                height = round(img.height * max_width / img.width)
+                img = img.resize((max_width, height), Image.Resampling.LANCZOS)
+            webp_path = png_path.with_suffix('.webp')
+            img.save(webp_path, "WEBP", lossless=True)
+        print(f"WebP copy saved as {webp_path}")
+
+# Write a gzip-compressed copy of every HTML export to results/<name>.html.gz
+def compress_html():
+    for html_path in sorted(results_folder.glob('*.html')):
+        gz_path = html_path.with_name(f"{html_path.name}.gz")
+        gz_path.write_bytes(gzip.compress(html_path.read_bytes(), compresslevel=9, mtime=0))
+        print(f"Compressed HTML saved as {gz_path}")
+
+if __name__ == "__main__":
+    make_composites()
+    make_thumbnails()
+    make_webp_copies()
+    compress_html()